@@ -1,151 +1,335 @@
+from typing import Final
+
 import streamlit as st
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-from PIL import Image, ImageDraw
 
-# Set page configuration
-st.set_page_config(
-    page_title="Rock Mass Rating (RMR) Calculator",
-    page_icon="⛏️",
-    layout="wide"
+
+# RMR parameter options, ratings and short condition labels
+
+# Parameter A1: Uniaxial Compressive Strength (UCS)
+UCS_OPTIONS: tuple[str, ...] = (
+    "> 250 MPa (15 points)", 
+    "100-250 MPa (12 points)", 
+    "50-100 MPa (7 points)", 
+    "25-50 MPa (4 points)", 
+    "5-25 MPa (2 points)", 
+    "1-5 MPa (1 point)", 
+    "< 1 MPa (0 points)"
 )
+UCS_RATINGS: tuple[int, ...] = (15, 12, 7, 4, 2, 1, 0)
+UCS_VALUES: tuple[str, ...] = (">250 MPa", "100-250 MPa", "50-100 MPa", "25-50 MPa", "5-25 MPa", "1-5 MPa", "<1 MPa")
 
-# Main title and description
-st.title("⛏️ Rock Mass Rating (RMR) Calculator")
-st.markdown("""
-This application calculates the Rock Mass Rating (RMR) based on Bieniawski's classification system
-and determines appropriate roof bolt support requirements for mining and tunneling operations.
-""")
+# Parameter A2: Rock Quality Designation (RQD)
+RQD_OPTIONS: tuple[str, ...] = (
+    "90-100% (20 points)", 
+    "75-90% (17 points)", 
+    "50-75% (13 points)", 
+    "25-50% (8 points)", 
+    "< 25% (3 points)"
+)
+RQD_RATINGS: tuple[int, ...] = (20, 17, 13, 8, 3)
+RQD_VALUES: tuple[str, ...] = ("90-100%", "75-90%", "50-75%", "25-50%", "<25%")
 
-# Create tabs for different sections of the app
-tab1, tab2, tab3 = st.tabs(["RMR Calculator", "Support Recommendations", "About RMR"])
+# Parameter A3: Spacing of Discontinuities
+SPACING_OPTIONS: tuple[str, ...] = (
+    "> 2 m (20 points)", 
+    "0.6-2 m (15 points)", 
+    "200-600 mm (10 points)", 
+    "60-200 mm (8 points)", 
+    "< 60 mm (5 points)"
+)
+SPACING_RATINGS: tuple[int, ...] = (20, 15, 10, 8, 5)
+SPACING_VALUES: tuple[str, ...] = (">2 m", "0.6-2 m", "200-600 mm", "60-200 mm", "<60 mm")
 
-with tab1:
-    st.header("RMR Calculation")
-    
-    # Sidebar for inputs
-    st.sidebar.header("Input Parameters")
-    
-    # Parameter A1: Uniaxial Compressive Strength (UCS)
-    st.sidebar.subheader("A1: Strength of Intact Rock Material")
-    ucs_options = [
-        "> 250 MPa (15 points)", 
-        "100-250 MPa (12 points)", 
-        "50-100 MPa (7 points)", 
-        "25-50 MPa (4 points)", 
-        "5-25 MPa (2 points)", 
-        "1-5 MPa (1 point)", 
-        "< 1 MPa (0 points)"
-    ]
-    ucs_option = st.sidebar.selectbox("Select rock strength:", ucs_options, index=2)
-    ucs_ratings = [15, 12, 7, 4, 2, 1, 0]
-    ucs_values = [">250 MPa", "100-250 MPa", "50-100 MPa", "25-50 MPa", "5-25 MPa", "1-5 MPa", "<1 MPa"]
-    ucs_index = ucs_options.index(ucs_option)
-    a1_rating = ucs_ratings[ucs_index]
-    ucs_value = ucs_values[ucs_index]
-    
-    # Parameter A2: Rock Quality Designation (RQD)
-    st.sidebar.subheader("A2: Rock Quality Designation (RQD)")
-    rqd_options = [
-        "90-100% (20 points)", 
-        "75-90% (17 points)", 
-        "50-75% (13 points)", 
-        "25-50% (8 points)", 
-        "< 25% (3 points)"
-    ]
-    rqd_option = st.sidebar.selectbox("Select RQD value:", rqd_options, index=2)
-    rqd_ratings = [20, 17, 13, 8, 3]
-    rqd_values = ["90-100%", "75-90%", "50-75%", "25-50%", "<25%"]
-    rqd_index = rqd_options.index(rqd_option)
-    a2_rating = rqd_ratings[rqd_index]
-    rqd_value = rqd_values[rqd_index]
-    
-    # Parameter A3: Spacing of Discontinuities
-    st.sidebar.subheader("A3: Spacing of Discontinuities")
-    spacing_options = [
-        "> 2 m (20 points)", 
-        "0.6-2 m (15 points)", 
-        "200-600 mm (10 points)", 
-        "60-200 mm (8 points)", 
-        "< 60 mm (5 points)"
-    ]
-    spacing_option = st.sidebar.selectbox("Select discontinuity spacing:", spacing_options, index=2)
-    spacing_ratings = [20, 15, 10, 8, 5]
-    spacing_values = [">2 m", "0.6-2 m", "200-600 mm", "60-200 mm", "<60 mm"]
-    spacing_index = spacing_options.index(spacing_option)
-    a3_rating = spacing_ratings[spacing_index]
-    spacing_value = spacing_values[spacing_index]
+# Parameter A4: Condition of Discontinuities
+CONDITION_OPTIONS: tuple[str, ...] = (
+    "Very rough, not continuous, no separation, unweathered (30 points)",
+    "Slightly rough, separation < 1 mm, slightly weathered (25 points)",
+    "Slightly rough, separation < 1 mm, highly weathered (20 points)",
+    "Slickensided/gouge < 5 mm, or separation 1-5 mm (10 points)",
+    "Soft gouge > 5 mm, or separation > 5 mm (0 points)"
+)
+CONDITION_RATINGS: tuple[int, ...] = (30, 25, 20, 10, 0)
+CONDITION_VALUES: tuple[str, ...] = (
+    "Very rough, not continuous, no separation, unweathered",
+    "Slightly rough, separation < 1 mm, slightly weathered",
+    "Slightly rough, separation < 1 mm, highly weathered",
+    "Slickensided/gouge < 5 mm, or separation 1-5 mm",
+    "Soft gouge > 5 mm, or separation > 5 mm"
+)
+
+# Parameter A5: Groundwater Conditions
+WATER_OPTIONS: tuple[str, ...] = (
+    "Completely dry (15 points)",
+    "Damp (10 points)",
+    "Wet (7 points)",
+    "Dripping (4 points)",
+    "Flowing (0 points)"
+)
+WATER_RATINGS: tuple[int, ...] = (15, 10, 7, 4, 0)
+WATER_VALUES: tuple[str, ...] = ("Completely dry", "Damp", "Wet", "Dripping", "Flowing")
+
+# Ratings for parameters A1-A5, in input order
+PARAMETER_RATINGS = (UCS_RATINGS, RQD_RATINGS, SPACING_RATINGS, CONDITION_RATINGS, WATER_RATINGS)
+
+# The same ratings as int8 lookup arrays for compute_rmr (the RMR total never exceeds 100)
+RATING_ARRAYS = tuple(np.array(ratings, dtype=np.int8) for ratings in PARAMETER_RATINGS)
+
+# Column headers for the results and support recommendation tables
+RESULTS_COLUMNS = ("Parameter", "Condition", "Rating")
+SUPPORT_COLUMNS = ("Support Parameter", "Recommendation")
+
+# Support descriptions that depend only on the rock class
+STATIC_SUPPORT: dict[str, dict[str, str]] = {
+    "I": {  # RMR 81-100
+        "bolt_pattern": "Spot bolting only where necessary",
+        "bolt_type": "Friction or Fully Grouted Bolts",
+        "bolt_capacity": "Low capacity (10-15 tons)",
+        "additional_support": "Generally no additional support required",
+    },
+    "II": {  # RMR 61-80
+        "bolt_pattern": "Systematic bolting at 1.5-2.0m spacing",
+        "bolt_type": "Fully Grouted Rebar or Friction Bolts",
+        "bolt_capacity": "Medium capacity (15-20 tons)",
+        "additional_support": "Spot mesh in crown where needed",
+    },
+    "III": {  # RMR 41-60
+        "bolt_pattern": "Systematic bolting at 1.0-1.5m spacing in crown and walls",
+        "bolt_type": "Fully Grouted Rebar",
+        "bolt_capacity": "Medium-high capacity (20-25 tons)",
+        "additional_support": "Wire mesh in crown; spot fiber-reinforced shotcrete (50mm)",
+    },
+    "IV": {  # RMR 21-40
+        "bolt_pattern": "Systematic bolting at 1.0m spacing with wire mesh in crown and walls",
+        "bolt_type": "Fully Grouted Rebar or Cable Bolts",
+        "bolt_capacity": "High capacity (25-30 tons)",
+        "additional_support": "Wire mesh in crown and walls; fiber-reinforced shotcrete (100-150mm)",
+    },
+    "V": {  # RMR < 21
+        "bolt_pattern": "Systematic bolting at 0.5-0.8m spacing with wire mesh and straps",
+        "bolt_type": "Fully Grouted Cable Bolts and Rebar",
+        "bolt_capacity": "Very high capacity (>30 tons)",
+        "additional_support": "Wire mesh with straps in crown and walls; fiber-reinforced shotcrete (150-200mm); light steel sets",
+    },
+}
+
+# Static content of the About tab
+ABOUT_MD: Final[str] = """
+## What is Rock Mass Rating (RMR)?
+
+The Rock Mass Rating (RMR) system is a geomechanical classification system developed by Z.T. Bieniawski between 1972 and 1973. It provides a method for estimating the quality of rock masses based on several parameters, and it helps in determining appropriate support systems for underground excavations.
+
+## Parameters of RMR
+
+The RMR system considers five main parameters:
+
+1. **Uniaxial Compressive Strength (UCS) of intact rock material** - Measures the strength of the rock when subjected to uniaxial compression.
+
+2. **Rock Quality Designation (RQD)** - An index that quantifies the degree of jointing or fracturing in a rock mass, measured as the percentage of intact core pieces longer than 10 cm in the total length of core.
+
+3. **Spacing of discontinuities** - The distance between adjacent discontinuities (joints, bedding planes, faults, etc.).
+
+4. **Condition of discontinuities** - Characteristics like roughness, separation, weathering, and infilling of the discontinuities.
+
+5. **Groundwater conditions** - The presence and pressure of water in the rock mass.
+
+## RMR Classification
+
+Based on the total RMR value (0-100), rock masses are classified into five categories:
+
+- **Class I (RMR 81-100)**: Very good rock
+- **Class II (RMR 61-80)**: Good rock
+- **Class III (RMR 41-60)**: Fair rock
+- **Class IV (RMR 21-40)**: Poor rock
+- **Class V (RMR < 21)**: Very poor rock
+
+## Applications of RMR
+
+The RMR system is widely used in:
+
+- Underground mining
+- Tunnel construction
+- Foundation design
+- Slope stability analysis
+- Determination of rock mass properties
+- Design of support systems for underground excavations
+
+## Limitations
+
+While RMR is a widely used system, it has some limitations:
+
+- It does not adequately account for stress conditions
+- It may not be suitable for very weak or highly weathered rock masses
+- It does not directly consider the influence of water pressure
+- It may not be applicable to all types of rock masses or geological conditions
+
+## References
+
+- Bieniawski, Z.T. (1973). "Engineering classification of jointed rock masses"
+- Bieniawski, Z.T. (1989). "Engineering Rock Mass Classifications"
+"""
+
+
+# Total RMR for option indices whose last axis is A1-A5; an (N, 5) array of
+# scenarios gives an (N,) array of ratings in one pass
+def compute_rmr(indices) -> np.ndarray:
+    indices = np.asarray(indices)
+    total = np.zeros(indices.shape[:-1], dtype=np.int8)
+    for param, ratings in enumerate(RATING_ARRAYS):
+        total += ratings[indices[..., param]]
+    return total
+
+
+# Lower RMR bound of classes IV, III, II and I, with the class, description and
+# display color of each band from class V upwards
+_BOUNDS = np.array([21, 41, 61, 81])
+_CLASSES = ("V", "IV", "III", "II", "I")
+_DESCRIPTIONS = ("Very poor rock", "Poor rock", "Fair rock", "Good rock", "Very good rock")
+_COLORS = ("red", "orange", "yellow", "lightgreen", "green")
+
+
+# Band index of an RMR value (0 = class V ... 4 = class I); works on scalars and arrays
+def rmr_class_index(rmr):
+    return np.searchsorted(_BOUNDS, rmr, side="right")
+
+
+# Determine rock mass class, description and display color for an RMR value
+def classify_rmr(rmr: int) -> tuple[str, str, str]:
+    band = int(rmr_class_index(rmr))
+    return _CLASSES[band], _DESCRIPTIONS[band], _COLORS[band]
+
+
+# The classification only has five distinct outputs, so tabulate it once per process
+_RMR_TABLE = [classify_rmr(i) for i in range(101)]
+
+
+# Derive numeric roof bolt support parameters for a rock class and excavation width
+@st.cache_data(max_entries=128, show_spinner=False)
+def support_params(rock_class: str, width: float) -> dict:
+    if rock_class == "I":  # RMR 81-100
+        bolt_length = max(2.0, width/5)
+        bolt_spacing = 2.0
+        
+    elif rock_class == "II":  # RMR 61-80
+        bolt_length = max(2.5, width/4)
+        bolt_spacing = 1.5
+        
+    elif rock_class == "III":  # RMR 41-60
+        bolt_length = max(3.0, width/3)
+        bolt_spacing = 1.2
+        
+    elif rock_class == "IV":  # RMR 21-40
+        bolt_length = max(4.0, width/2.5)
+        bolt_spacing = 1.0
+        
+    else:  # RMR < 21
+        bolt_length = max(4.5, width/2)
+        bolt_spacing = 0.6
     
-    # Parameter A4: Condition of Discontinuities
-    st.sidebar.subheader("A4: Condition of Discontinuities")
-    condition_options = [
-        "Very rough, not continuous, no separation, unweathered (30 points)",
-        "Slightly rough, separation < 1 mm, slightly weathered (25 points)",
-        "Slightly rough, separation < 1 mm, highly weathered (20 points)",
-        "Slickensided/gouge < 5 mm, or separation 1-5 mm (10 points)",
-        "Soft gouge > 5 mm, or separation > 5 mm (0 points)"
-    ]
-    condition_option = st.sidebar.selectbox("Select discontinuity condition:", condition_options, index=2)
-    condition_ratings = [30, 25, 20, 10, 0]
-    condition_values = [
-        "Very rough, not continuous, no separation, unweathered",
-        "Slightly rough, separation < 1 mm, slightly weathered",
-        "Slightly rough, separation < 1 mm, highly weathered",
-        "Slickensided/gouge < 5 mm, or separation 1-5 mm",
-        "Soft gouge > 5 mm, or separation > 5 mm"
-    ]
-    condition_index = condition_options.index(condition_option)
-    a4_rating = condition_ratings[condition_index]
-    condition_value = condition_values[condition_index]
+    # Calculate number of bolts per row and rows per meter of tunnel
+    if rock_class == "I":
+        bolts_per_row = max(2, round(width / bolt_spacing))
+        rows_per_meter = 0.5  # Spot bolting only
+    else:
+        bolts_per_row = max(3, round(width / bolt_spacing))
+        rows_per_meter = 1 / bolt_spacing
     
-    # Parameter A5: Groundwater Conditions
-    st.sidebar.subheader("A5: Groundwater Conditions")
-    water_options = [
-        "Completely dry (15 points)",
-        "Damp (10 points)",
-        "Wet (7 points)",
-        "Dripping (4 points)",
-        "Flowing (0 points)"
+    return {
+        "bolt_length": bolt_length,
+        "bolt_spacing": bolt_spacing,
+        "bolts_per_row": bolts_per_row,
+        "rows_per_meter": rows_per_meter,
+    }
+
+
+# Generate a visualization of the bolt pattern for the excavation as SVG markup
+@st.cache_data(max_entries=64, show_spinner=False)
+def generate_bolt_pattern_image(width, height, spacing, length, rock_class):
+    # Scale for visualization (pixels per meter)
+    scale = 50
+    padding = 20
+    img_width = int(width * scale) + 2 * padding
+    img_height = int(height * scale) + 2 * padding
+    
+    # Create the drawing on a white background
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{img_width}" height="{img_height}" '
+        f'viewBox="0 0 {img_width} {img_height}">',
+        f'<rect width="{img_width}" height="{img_height}" fill="white"/>',
     ]
-    water_option = st.sidebar.selectbox("Select groundwater condition:", water_options, index=1)
-    water_ratings = [15, 10, 7, 4, 0]
-    water_values = ["Completely dry", "Damp", "Wet", "Dripping", "Flowing"]
-    water_index = water_options.index(water_option)
-    a5_rating = water_ratings[water_index]
-    water_value = water_values[water_index]
     
-    # Add an excavation parameters section to the sidebar
-    st.sidebar.header("Excavation Parameters")
-    excavation_width = st.sidebar.number_input("Excavation Width (m):", min_value=1.0, max_value=30.0, value=5.0, step=0.5)
-    excavation_height = st.sidebar.number_input("Excavation Height (m):", min_value=1.0, max_value=30.0, value=3.5, step=0.5)
-    tunnel_length = st.sidebar.number_input("Tunnel Length (m):", min_value=1.0, max_value=1000.0, value=100.0, step=10.0)
-    
-    # Calculate the total RMR value
-    rmr_value = a1_rating + a2_rating + a3_rating + a4_rating + a5_rating
-    
-    # Determine rock mass class and description
-    if rmr_value >= 81 and rmr_value <= 100:
-        rock_class = "I"
-        description = "Very good rock"
-        class_color = "green"
-    elif rmr_value >= 61 and rmr_value <= 80:
-        rock_class = "II"
-        description = "Good rock"
-        class_color = "lightgreen"
-    elif rmr_value >= 41 and rmr_value <= 60:
-        rock_class = "III"
-        description = "Fair rock"
-        class_color = "yellow"
-    elif rmr_value >= 21 and rmr_value <= 40:
-        rock_class = "IV"
-        description = "Poor rock"
-        class_color = "orange"
+    # Draw excavation profile
+    parts.append(
+        f'<rect x="{padding}" y="{padding}" width="{int(width * scale)}" height="{int(height * scale)}" '
+        f'fill="none" stroke="black" stroke-width="3"/>'
+    )
+    
+    bolt_radius = 5
+    line_length = int(length * scale * 0.75)
+    head = f'<circle cx="{{}}" cy="{{}}" r="{bolt_radius}" fill="blue" stroke="black"/>'
+    
+    if rock_class == "I":  # Spot bolting only
+        # Just a few bolt heads in the crown, 0.5 m below the roof
+        py = padding + int(0.5 * scale)
+        for x in (width/4, width/2, 3*width/4):
+            parts.append(head.format(padding + int(x * scale), py))
     else:
-        rock_class = "V"
-        description = "Very poor rock"
-        class_color = "red"
+        # Systematic pattern based on spacing
+        rows = int(height / spacing) if rock_class in ["IV", "V"] else max(2, int(height / spacing))
+        cols = max(3, int(width / spacing))
+        
+        # For better classes, focus bolts more on the crown
+        crown_only = rock_class in ["II", "III"]
+        used_rows = min(rows, 2) if crown_only else rows
+        
+        # The systematic grid is regular, so draw one bolt as a pattern tile and fill
+        # the bolted area with it instead of emitting elements per bolt. Each tile is
+        # one grid cell with the bolt at its center, starting at the excavation corner.
+        pitch_x = width / cols * scale
+        pitch_y = height / rows * scale
+        grid_width = cols * pitch_x
+        first_row_y = padding + pitch_y / 2
+        
+        # Bolt length lines, tiled from the first row of bolt heads downwards; where
+        # lines are longer than the row pitch they join into one line per column
+        tile_line = min(line_length, pitch_y)
+        lines_height = (used_rows - 1) * pitch_y + line_length
+        
+        # Bolt heads, each with the top of its line drawn over it
+        head_stub = min(line_length, bolt_radius + 1)
+        
+        parts.append(
+            '<defs>'
+            f'<pattern id="bolt-lines" patternUnits="userSpaceOnUse" x="{padding}" y="{first_row_y:g}" '
+            f'width="{pitch_x:g}" height="{pitch_y:g}">'
+            f'<line x1="{pitch_x / 2:g}" y1="0" x2="{pitch_x / 2:g}" y2="{tile_line:g}" stroke="blue" stroke-width="2"/>'
+            '</pattern>'
+            f'<pattern id="bolt-heads" patternUnits="userSpaceOnUse" x="{padding}" y="{padding}" '
+            f'width="{pitch_x:g}" height="{pitch_y:g}">'
+            + head.format(f"{pitch_x / 2:g}", f"{pitch_y / 2:g}")
+            + f'<line x1="{pitch_x / 2:g}" y1="{pitch_y / 2:g}" x2="{pitch_x / 2:g}" y2="{pitch_y / 2 + head_stub:g}" '
+            'stroke="blue" stroke-width="2"/>'
+            '</pattern>'
+            '</defs>'
+        )
+        parts.append(
+            f'<rect x="{padding}" y="{first_row_y:g}" width="{grid_width:g}" height="{lines_height:g}" fill="url(#bolt-lines)"/>'
+        )
+        parts.append(
+            f'<rect x="{padding}" y="{padding}" width="{grid_width:g}" height="{used_rows * pitch_y:g}" fill="url(#bolt-heads)"/>'
+        )
+    
+    parts.append('</svg>')
+    return "".join(parts)
+
+
+# Render the RMR results table, gauge and class banner
+@st.fragment
+def render_rmr_panel(conditions: tuple, ratings: tuple, rmr_value: int):
+    rock_class, description, class_color = _RMR_TABLE[rmr_value]
+    ucs_value, rqd_value, spacing_value, condition_value, water_value = conditions
+    a1_rating, a2_rating, a3_rating, a4_rating, a5_rating = ratings
     
     # Create columns for displaying results
     col1, col2 = st.columns([2, 1])
@@ -154,48 +338,64 @@ with tab1:
         # Display results in a table
         st.subheader("RMR Calculation Results")
         
-        results_df = pd.DataFrame({
-            "Parameter": ["A1: Rock Strength", "A2: RQD", "A3: Spacing of Discontinuities", "A4: Condition of Discontinuities", "A5: Groundwater Conditions", "TOTAL RMR", "Rock Mass Class"],
-            "Condition": [ucs_value, rqd_value, spacing_value, condition_value, water_value, "", f"{rock_class} - {description}"],
-            "Rating": [a1_rating, a2_rating, a3_rating, a4_rating, a5_rating, rmr_value, ""]
-        })
+        results_df = pd.DataFrame.from_records([
+            ("A1: Rock Strength", ucs_value, a1_rating),
+            ("A2: RQD", rqd_value, a2_rating),
+            ("A3: Spacing of Discontinuities", spacing_value, a3_rating),
+            ("A4: Condition of Discontinuities", condition_value, a4_rating),
+            ("A5: Groundwater Conditions", water_value, a5_rating),
+            ("TOTAL RMR", "", rmr_value),
+            ("Rock Mass Class", f"{rock_class} - {description}", ""),
+        ], columns=RESULTS_COLUMNS)
         
         st.dataframe(results_df, use_container_width=True, hide_index=True)
     
     with col2:
-        # Display a gauge chart for the RMR
-        fig = go.Figure(go.Indicator(
-            mode = "gauge+number",
-            value = rmr_value,
-            domain = {'x': [0, 1], 'y': [0, 1]},
-            title = {'text': "Rock Mass Rating (RMR)"},
-            gauge = {
-                'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': "darkblue"},
-                'bar': {'color': class_color},
-                'bgcolor': "white",
-                'borderwidth': 2,
-                'bordercolor': "gray",
-                'steps': [
-                    {'range': [0, 20], 'color': 'red'},
-                    {'range': [20, 40], 'color': 'orange'},
-                    {'range': [40, 60], 'color': 'yellow'},
-                    {'range': [60, 80], 'color': 'lightgreen'},
-                    {'range': [80, 100], 'color': 'green'}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': rmr_value
-                }
-            }
-        ))
-        
-        fig.update_layout(
-            height=300,
-            margin=dict(l=20, r=20, t=50, b=20),
-        )
+        # Display the RMR value with a bar colored by rock class
+        st.metric(label="Rock Mass Rating", value=rmr_value, help=f"Class {rock_class}: {description}")
+        st.markdown(f"""
+        <svg width="100%" height="20" viewBox="0 0 100 20" preserveAspectRatio="none">
+            <rect x="0" y="0" width="100" height="20" fill="#eeeeee" />
+            <rect x="0" y="0" width="{rmr_value}" height="20" fill="{class_color}" />
+        </svg>
+        """, unsafe_allow_html=True)
         
-        st.plotly_chart(fig, use_container_width=True)
+        # The full gauge chart is optional; plotly is only imported when it is requested
+        if st.toggle("Show advanced gauge"):
+            import plotly.graph_objects as go
+            
+            fig = go.Figure(go.Indicator(
+                mode = "gauge+number",
+                value = rmr_value,
+                domain = {'x': [0, 1], 'y': [0, 1]},
+                title = {'text': "Rock Mass Rating (RMR)"},
+                gauge = {
+                    'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': "darkblue"},
+                    'bar': {'color': class_color},
+                    'bgcolor': "white",
+                    'borderwidth': 2,
+                    'bordercolor': "gray",
+                    'steps': [
+                        {'range': [0, 20], 'color': 'red'},
+                        {'range': [20, 40], 'color': 'orange'},
+                        {'range': [40, 60], 'color': 'yellow'},
+                        {'range': [60, 80], 'color': 'lightgreen'},
+                        {'range': [80, 100], 'color': 'green'}
+                    ],
+                    'threshold': {
+                        'line': {'color': "red", 'width': 4},
+                        'thickness': 0.75,
+                        'value': rmr_value
+                    }
+                }
+            ))
+            
+            fig.update_layout(
+                height=300,
+                margin=dict(l=20, r=20, t=50, b=20),
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
         
         # Add a simple visualization of the rock class
         st.markdown(f"""
@@ -204,163 +404,66 @@ with tab1:
         </div>
         """, unsafe_allow_html=True)
 
-with tab2:
-    st.header("Support Recommendations")
-    
+
+# Compute the support recommendations table and bolt pattern image
+def compute_support(rock_class: str, width: float, height: float, length: float):
     # Support recommendations based on RMR class
-    if rock_class == "I":  # RMR 81-100
-        bolt_length = max(2.0, excavation_width/5)
-        bolt_spacing = 2.0
-        bolt_pattern = "Spot bolting only where necessary"
-        bolt_type = "Friction or Fully Grouted Bolts"
-        bolt_capacity = "Low capacity (10-15 tons)"
-        additional_support = "Generally no additional support required"
-        
-    elif rock_class == "II":  # RMR 61-80
-        bolt_length = max(2.5, excavation_width/4)
-        bolt_spacing = 1.5
-        bolt_pattern = "Systematic bolting at 1.5-2.0m spacing"
-        bolt_type = "Fully Grouted Rebar or Friction Bolts"
-        bolt_capacity = "Medium capacity (15-20 tons)"
-        additional_support = "Spot mesh in crown where needed"
-        
-    elif rock_class == "III":  # RMR 41-60
-        bolt_length = max(3.0, excavation_width/3)
-        bolt_spacing = 1.2
-        bolt_pattern = "Systematic bolting at 1.0-1.5m spacing in crown and walls"
-        bolt_type = "Fully Grouted Rebar"
-        bolt_capacity = "Medium-high capacity (20-25 tons)"
-        additional_support = "Wire mesh in crown; spot fiber-reinforced shotcrete (50mm)"
-        
-    elif rock_class == "IV":  # RMR 21-40
-        bolt_length = max(4.0, excavation_width/2.5)
-        bolt_spacing = 1.0
-        bolt_pattern = "Systematic bolting at 1.0m spacing with wire mesh in crown and walls"
-        bolt_type = "Fully Grouted Rebar or Cable Bolts"
-        bolt_capacity = "High capacity (25-30 tons)"
-        additional_support = "Wire mesh in crown and walls; fiber-reinforced shotcrete (100-150mm)"
-        
-    else:  # RMR < 21
-        bolt_length = max(4.5, excavation_width/2)
-        bolt_spacing = 0.6
-        bolt_pattern = "Systematic bolting at 0.5-0.8m spacing with wire mesh and straps"
-        bolt_type = "Fully Grouted Cable Bolts and Rebar"
-        bolt_capacity = "Very high capacity (>30 tons)"
-        additional_support = "Wire mesh with straps in crown and walls; fiber-reinforced shotcrete (150-200mm); light steel sets"
-    
-    # Calculate number of bolts required
-    if rock_class == "I":
-        bolts_per_row = max(2, round(excavation_width / bolt_spacing))
-        rows_per_meter = 0.5  # Spot bolting only
-    else:
-        bolts_per_row = max(3, round(excavation_width / bolt_spacing))
-        rows_per_meter = 1 / bolt_spacing
+    static = STATIC_SUPPORT[rock_class]
+    support = support_params(rock_class, width)
+    bolt_length = support["bolt_length"]
+    bolt_spacing = support["bolt_spacing"]
+    bolts_per_row = support["bolts_per_row"]
+    rows_per_meter = support["rows_per_meter"]
     
     bolt_density = bolts_per_row * rows_per_meter  # bolts per meter of tunnel length
-    total_bolts = bolt_density * tunnel_length
+    total_bolts = bolt_density * length
     total_bolt_length = total_bolts * bolt_length
     
+    support_df = pd.DataFrame.from_records([
+        ("Bolt Length", f"{bolt_length:.2f} m"),
+        ("Bolt Spacing", f"{bolt_spacing:.2f} m"),
+        ("Pattern", static["bolt_pattern"]),
+        ("Recommended Bolt Type", static["bolt_type"]),
+        ("Required Bolt Capacity", static["bolt_capacity"]),
+        ("Additional Support", static["additional_support"]),
+        ("Bolts per Row", f"{bolts_per_row}"),
+        ("Rows per Meter", f"{rows_per_meter:.2f}"),
+        ("Bolt Density", f"{bolt_density:.2f} bolts/m"),
+        ("Total Bolts Required", f"{total_bolts:.0f} bolts"),
+        ("Total Bolt Length", f"{total_bolt_length:.0f} m"),
+    ], columns=SUPPORT_COLUMNS)
+    
+    # Generate the bolt pattern image
+    bolt_pattern_img = generate_bolt_pattern_image(
+        width, height, bolt_spacing, bolt_length, rock_class
+    )
+    
+    return support_df, bolt_pattern_img
+
+
+# Render the support recommendations table and bolt pattern visualization
+@st.fragment
+def render_support_panel(rock_class: str, width: float, height: float, length: float):
+    # Only recompute when the support inputs changed since the last run,
+    # e.g. a groundwater change that leaves the rock class as it was
+    support_key = (rock_class, width, height, length)
+    if st.session_state.get("_support_key") != support_key:
+        st.session_state["_support_result"] = compute_support(*support_key)
+        st.session_state["_support_key"] = support_key
+    support_df, bolt_pattern_img = st.session_state["_support_result"]
+    
     # Create columns for displaying support recommendations and visualization
     col1, col2 = st.columns([1, 1])
     
     with col1:
         # Display support recommendations in a table
         st.subheader("Roof Bolt Support Recommendations")
-        
-        support_df = pd.DataFrame({
-            "Support Parameter": [
-                "Bolt Length", "Bolt Spacing", "Pattern", "Recommended Bolt Type", 
-                "Required Bolt Capacity", "Additional Support", "Bolts per Row",
-                "Rows per Meter", "Bolt Density", "Total Bolts Required", "Total Bolt Length"
-            ],
-            "Recommendation": [
-                f"{bolt_length:.2f} m", f"{bolt_spacing:.2f} m", bolt_pattern, bolt_type,
-                bolt_capacity, additional_support, f"{bolts_per_row}",
-                f"{rows_per_meter:.2f}", f"{bolt_density:.2f} bolts/m", f"{total_bolts:.0f} bolts",
-                f"{total_bolt_length:.0f} m"
-            ]
-        })
-        
         st.dataframe(support_df, use_container_width=True, hide_index=True)
     
     with col2:
         # Create a visualization of the bolt pattern
         st.subheader("Bolt Pattern Visualization")
         
-        # Create a function to generate a bolt pattern visualization
-        def generate_bolt_pattern_image(width, height, spacing, length, rock_class):
-            # Scale for visualization (pixels per meter)
-            scale = 50
-            padding = 20
-            img_width = int(width * scale) + 2 * padding
-            img_height = int(height * scale) + 2 * padding
-            
-            # Create image and drawing context
-            img = Image.new('RGB', (img_width, img_height), color='white')
-            draw = ImageDraw.Draw(img)
-            
-            # Draw excavation profile
-            draw.rectangle(
-                [padding, padding, padding + int(width * scale), padding + int(height * scale)],
-                outline='black', width=3
-            )
-            
-            # Calculate bolt positions based on rock class and spacing
-            bolt_positions = []
-            
-            if rock_class == "I":  # Spot bolting only
-                # Just a few bolts in the crown
-                x_positions = [width/4, width/2, 3*width/4]
-                for x in x_positions:
-                    bolt_positions.append((x, 0.5))
-            else:
-                # Systematic pattern based on spacing
-                rows = int(height / spacing) if rock_class in ["IV", "V"] else max(2, int(height / spacing))
-                cols = max(3, int(width / spacing))
-                
-                # Place bolts in a grid pattern
-                for row in range(rows):
-                    for col in range(cols):
-                        # Adjust for even spacing
-                        x = (col + 0.5) * (width / cols)
-                        
-                        # For better classes, focus bolts more on the crown
-                        if rock_class in ["II", "III"] and row > 1:
-                            continue
-                        
-                        # Calculate y position (from top down)
-                        y = (row + 0.5) * (height / rows)
-                        
-                        bolt_positions.append((x, y))
-            
-            # Draw bolts
-            bolt_radius = 5
-            for x, y in bolt_positions:
-                # Calculate pixel coordinates
-                px = padding + int(x * scale)
-                py = padding + int(y * scale)
-                
-                # Draw bolt head
-                draw.ellipse(
-                    [px - bolt_radius, py - bolt_radius, px + bolt_radius, py + bolt_radius],
-                    fill='blue', outline='black'
-                )
-                
-                # Draw bolt length line (simplified vertical representation)
-                if rock_class != "I":
-                    draw.line(
-                        [px, py, px, py + int(length * scale * 0.75)],
-                        fill='blue', width=2
-                    )
-            
-            # Add title and legend
-            return img
-        
-        # Generate the bolt pattern image
-        bolt_pattern_img = generate_bolt_pattern_image(
-            excavation_width, excavation_height, bolt_spacing, bolt_length, rock_class
-        )
-        
         # Display the image
         st.image(bolt_pattern_img, caption=f"Roof Bolt Pattern - Rock Class {rock_class}", use_column_width=True)
         
@@ -372,63 +475,91 @@ with tab2:
         - Blue lines: Approximate bolt length
         """)
 
-with tab3:
+
+# Render the static About tab content
+@st.fragment
+def _render_about():
     st.header("About Rock Mass Rating (RMR)")
+    st.markdown(ABOUT_MD)
+
+
+# Set page configuration
+st.set_page_config(
+    page_title="Rock Mass Rating (RMR) Calculator",
+    page_icon="⛏️",
+    layout="wide"
+)
+
+# Main title and description
+st.title("⛏️ Rock Mass Rating (RMR) Calculator")
+st.markdown("""
+This application calculates the Rock Mass Rating (RMR) based on Bieniawski's classification system
+and determines appropriate roof bolt support requirements for mining and tunneling operations.
+""")
+
+# Create tabs for different sections of the app
+tab1, tab2, tab3 = st.tabs(["RMR Calculator", "Support Recommendations", "About RMR"])
+
+with tab1:
+    st.header("RMR Calculation")
     
-    st.markdown("""
-    ## What is Rock Mass Rating (RMR)?
-    
-    The Rock Mass Rating (RMR) system is a geomechanical classification system developed by Z.T. Bieniawski between 1972 and 1973. It provides a method for estimating the quality of rock masses based on several parameters, and it helps in determining appropriate support systems for underground excavations.
-    
-    ## Parameters of RMR
-    
-    The RMR system considers five main parameters:
-    
-    1. **Uniaxial Compressive Strength (UCS) of intact rock material** - Measures the strength of the rock when subjected to uniaxial compression.
-    
-    2. **Rock Quality Designation (RQD)** - An index that quantifies the degree of jointing or fracturing in a rock mass, measured as the percentage of intact core pieces longer than 10 cm in the total length of core.
-    
-    3. **Spacing of discontinuities** - The distance between adjacent discontinuities (joints, bedding planes, faults, etc.).
-    
-    4. **Condition of discontinuities** - Characteristics like roughness, separation, weathering, and infilling of the discontinuities.
-    
-    5. **Groundwater conditions** - The presence and pressure of water in the rock mass.
-    
-    ## RMR Classification
+    # Sidebar for inputs
+    st.sidebar.header("Input Parameters")
     
-    Based on the total RMR value (0-100), rock masses are classified into five categories:
+    # Parameter A1: Uniaxial Compressive Strength (UCS)
+    st.sidebar.subheader("A1: Strength of Intact Rock Material")
+    ucs_index = st.sidebar.selectbox("Select rock strength:", range(len(UCS_OPTIONS)), index=2, format_func=UCS_OPTIONS.__getitem__)
+    ucs_value = UCS_VALUES[ucs_index]
     
-    - **Class I (RMR 81-100)**: Very good rock
-    - **Class II (RMR 61-80)**: Good rock
-    - **Class III (RMR 41-60)**: Fair rock
-    - **Class IV (RMR 21-40)**: Poor rock
-    - **Class V (RMR < 21)**: Very poor rock
+    # Parameter A2: Rock Quality Designation (RQD)
+    st.sidebar.subheader("A2: Rock Quality Designation (RQD)")
+    rqd_index = st.sidebar.selectbox("Select RQD value:", range(len(RQD_OPTIONS)), index=2, format_func=RQD_OPTIONS.__getitem__)
+    rqd_value = RQD_VALUES[rqd_index]
     
-    ## Applications of RMR
+    # Parameter A3: Spacing of Discontinuities
+    st.sidebar.subheader("A3: Spacing of Discontinuities")
+    spacing_index = st.sidebar.selectbox("Select discontinuity spacing:", range(len(SPACING_OPTIONS)), index=2, format_func=SPACING_OPTIONS.__getitem__)
+    spacing_value = SPACING_VALUES[spacing_index]
     
-    The RMR system is widely used in:
+    # Parameter A4: Condition of Discontinuities
+    st.sidebar.subheader("A4: Condition of Discontinuities")
+    condition_index = st.sidebar.selectbox("Select discontinuity condition:", range(len(CONDITION_OPTIONS)), index=2, format_func=CONDITION_OPTIONS.__getitem__)
+    condition_value = CONDITION_VALUES[condition_index]
     
-    - Underground mining
-    - Tunnel construction
-    - Foundation design
-    - Slope stability analysis
-    - Determination of rock mass properties
-    - Design of support systems for underground excavations
+    # Parameter A5: Groundwater Conditions
+    st.sidebar.subheader("A5: Groundwater Conditions")
+    water_index = st.sidebar.selectbox("Select groundwater condition:", range(len(WATER_OPTIONS)), index=1, format_func=WATER_OPTIONS.__getitem__)
+    water_value = WATER_VALUES[water_index]
     
-    ## Limitations
+    # Add an excavation parameters section to the sidebar
+    st.sidebar.header("Excavation Parameters")
+    excavation_width = st.sidebar.number_input("Excavation Width (m):", min_value=1.0, max_value=30.0, value=5.0, step=0.5)
+    excavation_height = st.sidebar.number_input("Excavation Height (m):", min_value=1.0, max_value=30.0, value=3.5, step=0.5)
+    tunnel_length = st.sidebar.number_input("Tunnel Length (m):", min_value=1.0, max_value=1000.0, value=100.0, step=10.0)
     
-    While RMR is a widely used system, it has some limitations:
+    # Look up the ratings and calculate the total RMR value once
+    indices = (ucs_index, rqd_index, spacing_index, condition_index, water_index)
+    ratings = tuple(param_ratings[index] for param_ratings, index in zip(PARAMETER_RATINGS, indices))
+    rmr_value = sum(ratings)
     
-    - It does not adequately account for stress conditions
-    - It may not be suitable for very weak or highly weathered rock masses
-    - It does not directly consider the influence of water pressure
-    - It may not be applicable to all types of rock masses or geological conditions
+    # Determine rock mass class for the support recommendations
+    rock_class = _RMR_TABLE[rmr_value][0]
     
-    ## References
+    # Display results; the fragment only depends on the parameter conditions, ratings and total
+    render_rmr_panel(
+        (ucs_value, rqd_value, spacing_value, condition_value, water_value),
+        ratings,
+        rmr_value,
+    )
+
+with tab2:
+    st.header("Support Recommendations")
     
-    - Bieniawski, Z.T. (1973). "Engineering classification of jointed rock masses"
-    - Bieniawski, Z.T. (1989). "Engineering Rock Mass Classifications"
-    """)
+    # Display support recommendations; the fragment only depends on rock class and excavation size
+    render_support_panel(rock_class, excavation_width, excavation_height, tunnel_length)
+
+with tab3:
+    _render_about()
 
 # Add credits at the bottom
 st.sidebar.markdown("---")
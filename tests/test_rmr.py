@@ -0,0 +1,26 @@
+import itertools
+import unittest
+
+import numpy as np
+
+import streamlit_app as app
+
+
+class ComputeRmrTest(unittest.TestCase):
+    def test_matches_sum_of_ratings_for_every_combination(self):
+        option_counts = [len(ratings) for ratings in app.PARAMETER_RATINGS]
+        indices = np.array(list(itertools.product(*(range(n) for n in option_counts))))
+        self.assertEqual(len(indices), 4375)
+        
+        expected = [
+            sum(ratings[index] for ratings, index in zip(app.PARAMETER_RATINGS, row))
+            for row in indices.tolist()
+        ]
+        np.testing.assert_array_equal(app.compute_rmr(indices), expected)
+    
+    def test_single_point(self):
+        self.assertEqual(int(app.compute_rmr((2, 2, 2, 2, 1))), 7 + 13 + 10 + 20 + 10)
+
+
+if __name__ == "__main__":
+    unittest.main()